@@ -1,20 +1,35 @@
 import os
-from urllib.parse import urlparse
-from pathlib import Path
+from urllib.parse import urlsplit
 from datetime import timedelta
 
 from dotenv import load_dotenv
-from corsheaders.defaults import default_headers, default_methods
 
-load_dotenv()
+# Accepted spellings for boolean env flags
+_TRUE_VALUES = frozenset({"true", "True", "TRUE", "1", "yes", "on"})
 
-BASE_DIR = Path(__file__).resolve().parent.parent
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "django-insecure-change-this")
-DEBUG = os.getenv("DJANGO_DEBUG", "true").lower() == "true"
-ALLOWED_HOSTS = os.getenv("DJANGO_ALLOWED_HOSTS", "*").split(",")
+# Local development reads .env from the project root; deployments that inject
+# the environment directly can skip the file lookup with
+# DJANGO_READ_DOT_ENV_FILE=false.
+if os.environ.get("DJANGO_READ_DOT_ENV_FILE", "true") in _TRUE_VALUES:
+    load_dotenv(os.path.join(BASE_DIR, ".env"))
 
-INSTALLED_APPS = [
+# Snapshot the environment once; plain dict lookups skip os.environ's
+# per-access key/value encoding.
+_ENV = os.environ.copy()
+
+
+def _split_env_csv(name, default=""):
+    """Return the comma-separated values of an env var as a tuple, blanks dropped."""
+    return tuple(s for s in (p.strip() for p in _ENV.get(name, default).split(",")) if s)
+
+
+SECRET_KEY = _ENV.get("DJANGO_SECRET_KEY", "django-insecure-change-this")
+DEBUG = _ENV.get("DJANGO_DEBUG", "true") in _TRUE_VALUES
+ALLOWED_HOSTS = _split_env_csv("DJANGO_ALLOWED_HOSTS", "*")
+
+INSTALLED_APPS = (
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
@@ -28,9 +43,9 @@ INSTALLED_APPS = [
     "django_filters",
     # Local
     "core.apps.CoreConfig",
-]
+)
 
-MIDDLEWARE = [
+MIDDLEWARE = (
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -39,14 +54,14 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-]
+)
 
 ROOT_URLCONF = "academy.urls"
 
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
-        "DIRS": [BASE_DIR / "templates"],
+        "DIRS": [os.path.join(BASE_DIR, "templates")],
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
@@ -71,48 +86,45 @@ Priority order:
 3) DB_* environment variables (DB_NAME, DB_USER, etc.)
 4) Fallback to SQLite
 """
-_db_url = os.getenv("DATABASE_URL") or os.getenv("POSTGRES_URL") or os.getenv("PG_URL")
-if _db_url:
-    parsed = urlparse(_db_url)
-    DATABASES = {
-        "default": {
-            "ENGINE": "django.db.backends.postgresql",
-            "NAME": (parsed.path or "/").lstrip("/"),
-            "USER": parsed.username,
-            "PASSWORD": parsed.password,
-            "HOST": parsed.hostname,
-            "PORT": str(parsed.port or 5432),
-        }
-    }
-elif os.getenv("PGDATABASE"):
-    DATABASES = {
-        "default": {
-            "ENGINE": "django.db.backends.postgresql",
-            "NAME": os.getenv("PGDATABASE"),
-            "USER": os.getenv("PGUSER"),
-            "PASSWORD": os.getenv("PGPASSWORD"),
-            "HOST": os.getenv("PGHOST", "localhost"),
-            "PORT": os.getenv("PGPORT", "5432"),
-        }
-    }
-elif os.getenv("DB_NAME"):
-    DATABASES = {
-        "default": {
-            "ENGINE": "django.db.backends.postgresql",
-            "NAME": os.getenv("DB_NAME"),
-            "USER": os.getenv("DB_USER"),
-            "PASSWORD": os.getenv("DB_PASSWORD"),
-            "HOST": os.getenv("DB_HOST", "localhost"),
-            "PORT": os.getenv("DB_PORT", "5432"),
-        }
+
+
+def _pg(name, user, password, host, port):
+    return {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": name,
+        "USER": user,
+        "PASSWORD": password,
+        "HOST": host,
+        "PORT": port,
     }
+
+
+_DB_URL_KEYS = ("DATABASE_URL", "POSTGRES_URL", "PG_URL")
+# (name, user, password, host, port) variables, in priority order
+_DB_ENV_SCHEMES = (
+    ("PGDATABASE", "PGUSER", "PGPASSWORD", "PGHOST", "PGPORT"),
+    ("DB_NAME", "DB_USER", "DB_PASSWORD", "DB_HOST", "DB_PORT"),
+)
+
+_db_url = next((_ENV[k] for k in _DB_URL_KEYS if _ENV.get(k)), None)
+if _db_url:
+    # The URL is split rather than handed to libpq as a raw DSN: Django's
+    # postgresql backend requires NAME (or OPTIONS["service"]) and derives the
+    # test database name from it.
+    parsed = urlsplit(_db_url)
+    _db = _pg(parsed.path.lstrip("/"), parsed.username, parsed.password, parsed.hostname, parsed.port or 5432)
 else:
-    DATABASES = {
-        "default": {
+    for _name_key, _user_key, _password_key, _host_key, _port_key in _DB_ENV_SCHEMES:
+        _db_name = _ENV.get(_name_key)
+        if _db_name:
+            _db = _pg(_db_name, _ENV.get(_user_key), _ENV.get(_password_key), _ENV.get(_host_key, "localhost"), _ENV.get(_port_key, "5432"))
+            break
+    else:
+        _db = {
             "ENGINE": "django.db.backends.sqlite3",
-            "NAME": BASE_DIR / "db.sqlite3",
+            "NAME": os.path.join(BASE_DIR, "db.sqlite3"),
         }
-    }
+DATABASES = {"default": _db}
 
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -127,19 +139,19 @@ USE_I18N = True
 USE_TZ = True
 
 STATIC_URL = "/static/"
-STATIC_ROOT = BASE_DIR / "staticfiles"
+STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
 MEDIA_URL = "/media/"
-MEDIA_ROOT = BASE_DIR / "media"
+MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
 # Public base URL (e.g., https://api.example.com) used to form absolute URLs
 # in contexts like PDF generation when only relative paths are available.
 # Optional; leave empty if not needed.
-PUBLIC_BASE_URL = os.getenv("DJANGO_PUBLIC_BASE_URL", "").rstrip("/")
+PUBLIC_BASE_URL = _ENV.get("DJANGO_PUBLIC_BASE_URL", "").rstrip("/")
 
 # Logo URL for PDF headers; if provided, the PDF generator will fetch the logo
 # image from this absolute URL as a fallback when local files are unavailable.
-LOGO_URL = os.getenv("DJANGO_LOGO_URL", "")
+LOGO_URL = _ENV.get("DJANGO_LOGO_URL", "")
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -165,24 +177,14 @@ SIMPLE_JWT = {
 if DEBUG:
     CORS_ALLOW_ALL_ORIGINS = True
 else:
-    _cors_origins_env = os.getenv("DJANGO_CORS_ALLOWED_ORIGINS", "").strip()
-    if _cors_origins_env:
-        CORS_ALLOWED_ORIGINS = [o.strip() for o in _cors_origins_env.split(",") if o.strip()]
-    else:
-        CORS_ALLOWED_ORIGINS = [
-            "https://football-academy-frontend.vercel.app",
-        ]
-
-# Explicitly allow common headers/methods for preflight and JWT usage
-CORS_ALLOW_HEADERS = list(default_headers) + [
-    "authorization",
-    "content-type",
-]
-CORS_ALLOW_METHODS = list(default_methods) + [
-    "OPTIONS",
-]
+    CORS_ALLOWED_ORIGINS = _split_env_csv("DJANGO_CORS_ALLOWED_ORIGINS") or (
+        "https://football-academy-frontend.vercel.app",
+    )
+
+# CORS_ALLOW_HEADERS / CORS_ALLOW_METHODS are left at corsheaders' defaults,
+# which already allow the authorization and content-type headers and OPTIONS.
 
 # Optional CSRF trusted origins (useful when behind HTTPS/proxies)
-_csrf_origins_env = os.getenv("DJANGO_CSRF_TRUSTED_ORIGINS", "").strip()
-if _csrf_origins_env:
-    CSRF_TRUSTED_ORIGINS = [o.strip() for o in _csrf_origins_env.split(",") if o.strip()]
\ No newline at end of file
+_csrf_origins = _split_env_csv("DJANGO_CSRF_TRUSTED_ORIGINS")
+if _csrf_origins:
+    CSRF_TRUSTED_ORIGINS = _csrf_origins
\ No newline at end of file
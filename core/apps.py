@@ -3,4 +3,14 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "core"
\ No newline at end of file
+    name = "core"
+
+    def ready(self):
+        # REST_FRAMEWORK lists its classes as dotted paths (they cannot be
+        # imported from settings before the app registry is ready). Resolve
+        # them here so the imports happen at startup, not on the first request.
+        from rest_framework.settings import api_settings
+
+        api_settings.DEFAULT_AUTHENTICATION_CLASSES
+        api_settings.DEFAULT_PERMISSION_CLASSES
+        api_settings.DEFAULT_FILTER_BACKENDS
@@ -1,4 +1,9 @@
+import os
 from io import BytesIO
+from copy import copy
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import SimpleNamespace
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
@@ -10,11 +15,23 @@ from reportlab.lib.enums import TA_RIGHT
 from reportlab.lib.utils import ImageReader
 
 from django.conf import settings
-from pathlib import Path
+from django.db.models import Prefetch
 from datetime import datetime
-from urllib.request import urlopen
 from urllib.parse import urljoin
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional Arabic shaping support; without it Arabic text is passed through as-is
+try:
+    import arabic_reshaper  # type: ignore
+    from bidi.algorithm import get_display  # type: ignore
+
+    _ARABIC_AVAILABLE = True
+except ImportError:
+    _ARABIC_AVAILABLE = False
+
 
 def _safe_image(path, width=100, height=100):
     """Return an Image flowable if the resource is readable; otherwise None.
@@ -23,12 +40,37 @@ def _safe_image(path, width=100, height=100):
     OSError later. Proactively verify readability via ImageReader first.
     """
     try:
-        p = Path(path)
-        if not p.exists() or not p.is_file():
+        path = os.fspath(path)
+        if not os.path.isfile(path):
             return None
         # Attempt to read to ensure the file is a valid image
-        ImageReader(str(p))
-        return Image(str(p), width=width, height=height)
+        ImageReader(path)
+        return Image(path, width=width, height=height)
+    except Exception:
+        return None
+
+
+# Shared HTTP session so logo/photo downloads reuse keep-alive connections.
+# Pool size covers the concurrent photo fetches in build_group_report;
+# connection errors are retried briefly, HTTP error statuses are not.
+_HTTP_SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(connect=2, read=0, backoff_factor=0.2),
+)
+_HTTP_SESSION.mount("http://", _HTTP_ADAPTER)
+_HTTP_SESSION.mount("https://", _HTTP_ADAPTER)
+
+
+def _url_bytes(url: str) -> bytes | None:
+    """Return the body of an HTTP(S) URL, or None if it cannot be fetched."""
+    try:
+        if not url or not (url.startswith("http://") or url.startswith("https://")):
+            return None
+        resp = _HTTP_SESSION.get(url, timeout=6)
+        resp.raise_for_status()
+        return resp.content
     except Exception:
         return None
 
@@ -36,21 +78,31 @@ def _safe_image(path, width=100, height=100):
 def _url_image(url: str, width: int = 100, height: int = 100):
     """Return an Image from an HTTP(S) URL if retrievable; otherwise None."""
     try:
-        if not url or not (url.startswith("http://") or url.startswith("https://")):
+        data = _url_bytes(url)
+        if not data:
             return None
-        with urlopen(url, timeout=6) as resp:
-            data = resp.read()
-        img_reader = ImageReader(BytesIO(data))
-        return Image(img_reader, width=width, height=height)
+        # Validate eagerly; the Image flowable itself reads lazily at build time
+        ImageReader(BytesIO(data))
+        return Image(BytesIO(data), width=width, height=height)
     except Exception:
         return None
 
 
 def _image_from_field(field, width: int = 100, height: int = 100):
-    """Return an Image from a Django FileField/FieldFile, reading bytes via storage.
+    """Return an Image from a Django FileField/FieldFile.
 
-    This avoids reliance on local filesystem paths and works with remote storages.
+    Local storages hand ReportLab the file path, which it reads lazily at
+    build time. Storages without paths (remote) are read via the storage API.
     """
+    try:
+        path = field.storage.path(field.name)
+    except Exception:
+        # Remote storages raise NotImplementedError here
+        path = None
+    if path:
+        img = _safe_image(path, width=width, height=height)
+        if img:
+            return img
     try:
         # FieldFile.open sets up the file object on the storage; ensure close afterwards
         field.open("rb")
@@ -58,57 +110,114 @@ def _image_from_field(field, width: int = 100, height: int = 100):
             data = field.read()
         finally:
             field.close()
-        img_reader = ImageReader(BytesIO(data))
-        return Image(img_reader, width=width, height=height)
+        # Validate eagerly; BytesIO wraps the bytes without copying them
+        ImageReader(BytesIO(data))
+        return Image(BytesIO(data), width=width, height=height)
     except Exception:
         return None
 
 
-def _logo_image(width: int = 60, height: int = 60):
-    """Return the academy logo Image flowable if found.
+def _player_photo(photo, size: int):
+    """Return a square Image for a player's photo field, or None.
+
+    Prefers storage bytes (works for local and remote storages), then the
+    local media path, then PUBLIC_BASE_URL + the relative media URL.
+    """
+    if not photo:
+        return None
+    img = _image_from_field(photo, width=size, height=size)
+    if img:
+        return img
+    # Fallback to local filesystem path
+    img_path = getattr(photo, "path", None)
+    if not img_path:
+        img_path = os.path.join(settings.MEDIA_ROOT, photo.name)
+    img = _safe_image(img_path, width=size, height=size)
+    if img:
+        return img
+    # Last resort: try via PUBLIC_BASE_URL + relative media URL
+    url = getattr(photo, "url", None)
+    base = getattr(settings, "PUBLIC_BASE_URL", "")
+    if url and base and url.startswith("/"):
+        return _url_image(urljoin(base + "/", url.lstrip("/")), width=size, height=size)
+    return None
+
+
+# Photos are fetched concurrently for group reports; the work is I/O bound
+_PHOTO_FETCH_WORKERS = 8
+
+
+# Logo image bytes, cached after the first successful lookup
+_LOGO_BYTES: bytes | None = None
+# Logo candidate paths found missing; skipped on later lookups without a stat()
+_MISSING_PATHS: set[str] = set()
+
+
+def _logo_bytes() -> bytes | None:
+    """Return the academy logo image bytes, or None if not found.
 
     Tries multiple likely locations across this repo so development and
-    deployment both work without configuration.
+    deployment both work without configuration, then the configurable
+    LOGO_URL. A found logo is cached for the process; misses are retried.
     """
+    global _LOGO_BYTES
+    if _LOGO_BYTES:
+        return _LOGO_BYTES
     try:
-        base = Path(__file__).resolve().parent
-        backend_root = base.parent
+        base = os.path.dirname(os.path.abspath(__file__))
+        backend_root = os.path.dirname(base)
         # Typical Django BASE_DIR points at the project dir (academy)
-        base_dir = Path(getattr(settings, "BASE_DIR", backend_root)).resolve()
+        base_dir = os.path.abspath(getattr(settings, "BASE_DIR", backend_root))
+        workspace = os.path.dirname(base_dir)
 
         candidates = [
-            base / "logo.png",
-            base / "fonts" / "logo.png",
-            backend_root / "core" / "logo.png",
-            backend_root / "core" / "fonts" / "logo.png",
+            os.path.join(base, "logo.png"),
+            os.path.join(base, "fonts", "logo.png"),
+            os.path.join(backend_root, "core", "logo.png"),
+            os.path.join(backend_root, "core", "fonts", "logo.png"),
             # Frontend public assets in monorepo
-            base_dir.parent / "football-academy-frontend" / "public" / "logo.png",
-            base_dir.parent.parent / "football-academy-frontend" / "public" / "logo.png",
+            os.path.join(workspace, "football-academy-frontend", "public", "logo.png"),
+            os.path.join(os.path.dirname(workspace), "football-academy-frontend", "public", "logo.png"),
         ]
 
         for p in candidates:
-            img = _safe_image(p, width=width, height=height)
-            if img:
-                try:
-                    img.hAlign = "LEFT"
-                except Exception:
-                    pass
-                return img
+            if p in _MISSING_PATHS:
+                continue
+            try:
+                if not os.path.isfile(p):
+                    _MISSING_PATHS.add(p)
+                    continue
+                with open(p, "rb") as fh:
+                    data = fh.read()
+                # Ensure the file is a valid image before caching it
+                ImageReader(BytesIO(data))
+            except Exception:
+                continue
+            _LOGO_BYTES = data
+            return data
     except Exception:
         pass
     # Final fallback: configurable logo URL
+    data = _url_bytes(getattr(settings, "LOGO_URL", ""))
+    if data:
+        _LOGO_BYTES = data
+    return data
+
+
+def _logo_image(width: int = 60, height: int = 60):
+    """Return the academy logo Image flowable if found.
+
+    A fresh flowable is built from the cached bytes for every report.
+    """
+    data = _logo_bytes()
+    if not data:
+        return None
     try:
-        logo_url = getattr(settings, "LOGO_URL", "")
-        img = _url_image(logo_url, width=width, height=height)
-        if img:
-            try:
-                img.hAlign = "LEFT"
-            except Exception:
-                pass
-            return img
+        img = Image(BytesIO(data), width=width, height=height)
+        img.hAlign = "LEFT"
+        return img
     except Exception:
-        pass
-    return None
+        return None
 
 
 # Rating label helpers (1–5)
@@ -175,6 +284,10 @@ def with_translation(label: str) -> str:
 
 
 # Arabic font registration and shaping
+# Font name resolved by _register_arabic_font, cached for the process lifetime
+_ARABIC_FONT_NAME: str | None = None
+
+
 def _register_arabic_font() -> str:
     """Register and return an Arabic-capable TrueType font name.
 
@@ -183,87 +296,119 @@ def _register_arabic_font() -> str:
     - Falls back to system fonts like Arial/Tahoma on Windows.
     - As a last resort, returns "Helvetica" (which will not render Arabic properly).
     """
+    global _ARABIC_FONT_NAME
+    if _ARABIC_FONT_NAME:
+        return _ARABIC_FONT_NAME
+
     # Reuse previously registered font if available
     if "ArabicFont" in pdfmetrics.getRegisteredFontNames():
-        return "ArabicFont"
+        _ARABIC_FONT_NAME = "ArabicFont"
+        return _ARABIC_FONT_NAME
 
-    base = Path(__file__).resolve().parent
+    fonts_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
     local_fonts = [
-        base / "fonts" / "NotoNaskhArabic-Regular.ttf",
-        base / "fonts" / "DejaVuSans.ttf",
+        os.path.join(fonts_dir, "NotoNaskhArabic-Regular.ttf"),
+        os.path.join(fonts_dir, "DejaVuSans.ttf"),
     ]
 
     windows_candidates = [
-        Path(r"C:\\Windows\\Fonts\\NotoNaskhArabic-Regular.ttf"),
-        Path(r"C:\\Windows\\Fonts\\arial.ttf"),
-        Path(r"C:\\Windows\\Fonts\\tahoma.ttf"),
-        Path(r"C:\\Windows\\Fonts\\times.ttf"),
-        Path(r"C:\\Windows\\Fonts\\segoeui.ttf"),
-        Path(r"C:\\Windows\\Fonts\\TraditionalArabic.ttf"),
+        r"C:\\Windows\\Fonts\\NotoNaskhArabic-Regular.ttf",
+        r"C:\\Windows\\Fonts\\arial.ttf",
+        r"C:\\Windows\\Fonts\\tahoma.ttf",
+        r"C:\\Windows\\Fonts\\times.ttf",
+        r"C:\\Windows\\Fonts\\segoeui.ttf",
+        r"C:\\Windows\\Fonts\\TraditionalArabic.ttf",
     ]
 
     linux_candidates = [
-        Path("/usr/share/fonts/truetype/noto/NotoNaskhArabic-Regular.ttf"),
-        Path("/usr/share/fonts/opentype/noto/NotoNaskhArabic-Regular.ttf"),
-        Path("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"),
-        Path("/usr/share/fonts/truetype/ttf-dejavu/DejaVuSans.ttf"),
-        Path("/usr/share/fonts/truetype/freefont/FreeSans.ttf"),
+        "/usr/share/fonts/truetype/noto/NotoNaskhArabic-Regular.ttf",
+        "/usr/share/fonts/opentype/noto/NotoNaskhArabic-Regular.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/ttf-dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
     ]
 
     mac_candidates = [
-        Path("/Library/Fonts/Arial Unicode.ttf"),
-        Path("/Library/Fonts/Arial Unicode MS.ttf"),
-        Path("/Library/Fonts/Tahoma.ttf"),
+        "/Library/Fonts/Arial Unicode.ttf",
+        "/Library/Fonts/Arial Unicode MS.ttf",
+        "/Library/Fonts/Tahoma.ttf",
         # Geeza Pro is Arabic-capable but often in TTC; skip TTC to avoid errors
-        Path("/Library/Fonts/DejaVuSans.ttf"),
+        "/Library/Fonts/DejaVuSans.ttf",
     ]
 
-    candidates: list[Path] = local_fonts + windows_candidates + linux_candidates + mac_candidates
+    candidates: list[str] = local_fonts + windows_candidates + linux_candidates + mac_candidates
 
     # Add local fonts directory to ReportLab TTF search path (harmless if duplicate)
     try:
-        rl_config.TTFSearchPath = list({*rl_config.TTFSearchPath, str(base / "fonts")} )
+        rl_config.TTFSearchPath = list({*rl_config.TTFSearchPath, fonts_dir} )
     except Exception:
         pass
 
+    # List each candidate directory once rather than stat()ing every file
+    dir_entries: dict[str, set[str]] = {}
     for path in candidates:
+        parent, name = os.path.split(path)
+        if parent not in dir_entries:
+            try:
+                with os.scandir(parent) as it:
+                    dir_entries[parent] = {os.path.normcase(entry.name) for entry in it}
+            except OSError:
+                dir_entries[parent] = set()
+        if os.path.normcase(name) not in dir_entries[parent]:
+            continue
         try:
-            if path.exists():
-                pdfmetrics.registerFont(TTFont("ArabicFont", str(path)))
-                return "ArabicFont"
+            pdfmetrics.registerFont(TTFont("ArabicFont", path))
+            _ARABIC_FONT_NAME = "ArabicFont"
+            return _ARABIC_FONT_NAME
         except Exception:
             # Try next candidate
             continue
-    return "Helvetica"
+    _ARABIC_FONT_NAME = "Helvetica"
+    return _ARABIC_FONT_NAME
 
 
+@lru_cache(maxsize=512)
 def _shape_arabic(text: str) -> str:
-    """Shape Arabic text using arabic_reshaper and python-bidi if available."""
-    try:
-        import arabic_reshaper  # type: ignore
-        from bidi.algorithm import get_display  # type: ignore
+    """Shape Arabic text using arabic_reshaper and python-bidi if available.
 
-        if not text:
-            return text
-        reshaped = arabic_reshaper.reshape(text)
-        return get_display(reshaped)
+    Reports shape the same small set of labels over and over, so results are
+    cached per process.
+    """
+    if not text or not _ARABIC_AVAILABLE:
+        return text
+    try:
+        return get_display(arabic_reshaper.reshape(text))
     except Exception:
         return text
 
 
+# Translation tables shaped once at import (unshaped when shaping is unavailable)
+SKILL_TRANSLATIONS_AR_SHAPED = {k: _shape_arabic(v) for k, v in SKILL_TRANSLATIONS_AR.items()}
+
+
 def with_translation_text(label: str) -> str:
-    tr = SKILL_TRANSLATIONS_AR.get(label)
-    if tr:
-        return f"{label} ({_shape_arabic(tr)})"
+    shaped = SKILL_TRANSLATIONS_AR_SHAPED.get(label)
+    if shaped:
+        return f"{label} ({shaped})"
     return label
 
 
 def with_translation_html(label: str, english_font_name: str = "Helvetica", arabic_font_name: str | None = None) -> str:
-    """Return inline bilingual HTML: English - Arabic (shaped), with fonts."""
+    """Return inline bilingual HTML: English - Arabic (shaped), with fonts.
+
+    Without an Arabic-capable font the Arabic part would only render as
+    boxes, so just the English label is returned.
+    """
     ar_font = arabic_font_name or _register_arabic_font()
-    tr = SKILL_TRANSLATIONS_AR.get(label)
-    if tr:
-        shaped = _shape_arabic(tr)
+    if ar_font == "Helvetica":
+        return f'<font name="{english_font_name}">{label}</font>'
+    return _cached_with_translation_html(label, english_font_name, ar_font)
+
+
+@lru_cache(maxsize=256)
+def _cached_with_translation_html(label: str, english_font_name: str, ar_font: str) -> str:
+    shaped = SKILL_TRANSLATIONS_AR_SHAPED.get(label)
+    if shaped:
         return f'<font name="{english_font_name}">{label}</font> - <font name="{ar_font}">{shaped}</font>'
     return f'<font name="{english_font_name}">{label}</font>'
 
@@ -274,6 +419,16 @@ def with_translation_para(label: str, style) -> Paragraph:
     html = with_translation_html(label, english_font_name="Helvetica", arabic_font_name=_register_arabic_font())
     return Paragraph(html, style)
 
+
+@lru_cache(maxsize=4)
+def _skill_label_paragraphs(style) -> dict[str, Paragraph]:
+    """Return prebuilt bilingual Paragraphs for every skill label in ``style``.
+
+    Flowables keep layout state from wrap(), so callers place a copy() of an
+    entry in their story rather than the cached instance itself.
+    """
+    return {label: with_translation_para(label, style) for label in SKILL_TRANSLATIONS_AR}
+
 # Section title translations (bilingual headers)
 SECTION_TRANSLATIONS_AR = {
     "Technical skills in relation to the football context (decision making)": "مهارات فنية مرتبطة بالمباراه (خاصة بإتخاذ القرار))",
@@ -282,19 +437,25 @@ SECTION_TRANSLATIONS_AR = {
     "Psychological and mental aspects should be in the context of life skills": "الجوانب النفسية و الذهنية في اطار مهارات الحياة",
     "Average Level": "المستوى العام",
 }
+SECTION_TRANSLATIONS_AR_SHAPED = {k: _shape_arabic(v) for k, v in SECTION_TRANSLATIONS_AR.items()}
 
 def with_section_title_text(title: str) -> str:
-    tr = SECTION_TRANSLATIONS_AR.get(title)
-    if tr:
-        return f"{title} ({_shape_arabic(tr)})"
+    shaped = SECTION_TRANSLATIONS_AR_SHAPED.get(title)
+    if shaped:
+        return f"{title} ({shaped})"
     return title
 
 def with_section_title_html(title: str, english_font_name: str = "Helvetica", arabic_font_name: str | None = None) -> str:
-    """Inline bilingual section title: English / Arabic (shaped)."""
+    """Inline bilingual section title: English / Arabic (shaped); English only without an Arabic font."""
     ar_font = arabic_font_name or _register_arabic_font()
-    tr = SECTION_TRANSLATIONS_AR.get(title)
-    if tr:
-        shaped = _shape_arabic(tr)
+    if ar_font == "Helvetica":
+        return f'<font name="{english_font_name}">{title}</font>'
+    return _cached_with_section_title_html(title, english_font_name, ar_font)
+
+@lru_cache(maxsize=64)
+def _cached_with_section_title_html(title: str, english_font_name: str, ar_font: str) -> str:
+    shaped = SECTION_TRANSLATIONS_AR_SHAPED.get(title)
+    if shaped:
         return f'<font name="{english_font_name}">{title}</font> / <font name="{ar_font}">{shaped}</font>'
     return f'<font name="{english_font_name}">{title}</font>'
 
@@ -306,18 +467,89 @@ RATING_TRANSLATIONS_AR = {
     "Very Good": "جيد جدًا",
     "Excellent": "ممتاز",
 }
+RATING_TRANSLATIONS_AR_SHAPED = {k: _shape_arabic(v) for k, v in RATING_TRANSLATIONS_AR.items()}
 
 def rating_bilingual_html(value) -> str:
     label = rating_label(value)
-    ar = RATING_TRANSLATIONS_AR.get(label)
-    if ar:
-        return f'<font name="Helvetica">{label}</font> / <font name="{_register_arabic_font()}">{_shape_arabic(ar)}</font>'
+    ar_font = _register_arabic_font()
+    if ar_font == "Helvetica":
+        return f'<font name="Helvetica">{label}</font>'
+    return _cached_rating_bilingual_html(label, ar_font)
+
+@lru_cache(maxsize=32)
+def _cached_rating_bilingual_html(label: str, ar_font: str) -> str:
+    shaped = RATING_TRANSLATIONS_AR_SHAPED.get(label)
+    if shaped:
+        return f'<font name="Helvetica">{label}</font> / <font name="{ar_font}">{shaped}</font>'
     return f'<font name="Helvetica">{label}</font>'
 
 def rating_bilingual_html_from_average(avg: float | None) -> str:
     return rating_bilingual_html(rating_label_from_average(avg))
 
 
+@lru_cache(maxsize=4)
+def _rating_paragraphs(style) -> dict:
+    """Return prebuilt rating Paragraphs for ``style``, keyed by rating value (None, 1–5).
+
+    As with _skill_label_paragraphs, callers place a copy() in their story.
+    """
+    return {v: Paragraph(rating_bilingual_html(v), style) for v in (None, 1, 2, 3, 4, 5)}
+
+
+@lru_cache(maxsize=1)
+def _styles() -> SimpleNamespace:
+    """Return the report paragraph styles, built once per process.
+
+    The Arabic styles use _register_arabic_font(), which is itself cached.
+    """
+    sheet = getSampleStyleSheet()
+
+    # Compact styles to fit on a single page
+    small_title = sheet["Title"].clone("SmallTitle")
+    small_title.fontSize = 16
+    small_title.leading = 18
+    small_h2 = sheet["Heading2"].clone("SmallH2")
+    small_h2.fontSize = 11
+    small_h2.leading = 13
+    small_h3 = sheet["Heading3"].clone("SmallH3")
+    small_h3.fontSize = 10
+    small_h3.leading = 12
+    normal_small = sheet["Normal"].clone("NormalSmall")
+    normal_small.fontSize = 9
+    normal_small.leading = 11
+
+    # Arabic-capable styles
+    arabic_font = _register_arabic_font()
+    arabic_label = normal_small.clone("ArabicLabel")
+    arabic_label.fontName = arabic_font
+    small_h3_ar = small_h3.clone("SmallH3Arabic")
+    small_h3_ar.fontName = arabic_font
+    arabic_right_heading = small_h3_ar.clone("ArabicRightHeading")
+    arabic_right_heading.alignment = TA_RIGHT
+
+    return SimpleNamespace(
+        title=sheet["Title"],
+        heading2=sheet["Heading2"],
+        normal=sheet["Normal"],
+        small_title=small_title,
+        small_h2=small_h2,
+        small_h3=small_h3,
+        normal_small=normal_small,
+        arabic_font=arabic_font,
+        arabic_label=arabic_label,
+        small_h3_ar=small_h3_ar,
+        arabic_right_heading=arabic_right_heading,
+    )
+
+
+def _rating_para(ratings: dict, value, style) -> Paragraph:
+    """Return a copy of the prebuilt rating Paragraph, or build one for unexpected values."""
+    para = ratings.get(value)
+    if para is None:
+        return Paragraph(rating_bilingual_html(value), style)
+    return copy(para)
+
+
 def _latest_evaluation(player):
     """Return the most recent evaluation for a player, or None.
 
@@ -325,7 +557,10 @@ def _latest_evaluation(player):
     evaluated_at then updated_at, descending.
     """
     try:
-        # Use in-memory prefetch when available; otherwise query.
+        # Use in-memory prefetch when available (build_group_report prefetches
+        # evaluations already in this order); otherwise query.
+        if "evaluations" in getattr(player, "_prefetched_objects_cache", {}):
+            return next(iter(player.evaluations.all()), None)
         qs = getattr(player, "evaluations", None)
         if qs is None:
             return None
@@ -334,111 +569,155 @@ def _latest_evaluation(player):
         return None
 
 
+# Table styles shared by every report (Table.setStyle only reads the commands)
+_GROUP_HEADER_STYLE = TableStyle([
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("LEFTPADDING", (0, 0), (-1, -1), 0),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+    ("TOPPADDING", (0, 0), (-1, -1), 0),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+])
+
+_GROUP_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+])
+
+_PLAYER_HEADER_STYLE = TableStyle([
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("ALIGN", (2, 0), (2, 0), "RIGHT"),
+    ("LEFTPADDING", (0, 0), (-1, -1), 0),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+    ("TOPPADDING", (0, 0), (-1, -1), 0),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+])
+
+_SKILL_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+    ("LEFTPADDING", (0, 0), (-1, -1), 3),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 3),
+    ("TOPPADDING", (0, 0), (-1, -1), 2),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+])
+
+
+# Player report skill tables: (section title, header label, [(evaluation field, skill label), ...])
+_PLAYER_REPORT_SECTIONS = (
+    ("Technical skills in relation to the football context (decision making)", "Skill", (
+        ("passing", "Passing"),
+        ("ball_control", "Ball receiving and post-reception action"),
+        ("dribbling", "Dribbling"),
+        ("shooting", "Shooting"),
+        ("using_both_feet", "Using both feet"),
+    )),
+    ("Physical abilities in relation to the football context", "Attribute", (
+        ("speed", "Speed"),
+        ("agility", "Agility"),
+        ("endurance", "Endurance"),
+        ("strength", "Strength"),
+    )),
+    ("Tactical skills should be in the context of (awareness and decision making)", "Aspect", (
+        ("positioning", "Awareness of correct positioning"),
+        ("decision_making", "make the right decisions during the game"),
+        ("game_awareness", "Awareness of opponents and teammates"),
+        ("teamwork", "Teamwork"),
+    )),
+    ("Psychological and mental aspects should be in the context of life skills", "Aspect", (
+        ("respect", "Respect"),
+        ("sportsmanship", "Sportsmanship"),
+        ("confidence", "Self-confidence"),
+        ("leadership", "Leadership"),
+    )),
+)
+
+
 def build_group_report(group) -> bytes:
+    """Return the group report PDF as bytes."""
     buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4)
-    styles = getSampleStyleSheet()
+    build_group_report_to(buffer, group)
+    pdf = buffer.getvalue()
+    buffer.close()
+    return pdf
+
+
+def build_group_report_to(fileobj, group) -> None:
+    """Write the group report PDF to a writable file-like object.
+
+    ReportLab writes straight to ``fileobj`` (e.g. an HttpResponse), so the
+    document is never held in an intermediate buffer.
+    """
+    doc = SimpleDocTemplate(fileobj, pagesize=A4)
+    styles = _styles()
     story = []
 
     # Header with logo on the top-left
     logo = _logo_image(width=60, height=60)
-    title_para = Paragraph(f"Group Report: {group.name}", styles["Title"])
-    coach_para = Paragraph(f"Coach: {group.coach}", styles["Heading2"])
+    title_para = Paragraph(f"Group Report: {group.name}", styles.title)
+    coach_para = Paragraph(f"Coach: {group.coach}", styles.heading2)
     header = Table(
         [[logo if logo else "", title_para], ["", coach_para]],
         colWidths=[70, None],
     )
-    header.setStyle(TableStyle([
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("LEFTPADDING", (0, 0), (-1, -1), 0),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-        ("TOPPADDING", (0, 0), (-1, -1), 0),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-    ]))
+    header.setStyle(_GROUP_HEADER_STYLE)
     story.append(header)
     story.append(Spacer(1, 12))
 
     # Summary table with phone and average rating
     data = [["Photo", "Player", "Phone", "Avg"]]
-    # Prefetch evaluations to avoid N+1 queries after relationship change
-    for p in group.players.prefetch_related("evaluations").all():
-        img = None
-        if p.photo:
-            # Prefer storage bytes (works for local and remote storages)
-            img = _image_from_field(p.photo, width=50, height=50)
-            if not img:
-                # Fallback to local filesystem path
-                img_path = getattr(p.photo, "path", None)
-                if not img_path:
-                    img_path = str(Path(settings.MEDIA_ROOT) / p.photo.name)
-                img = _safe_image(img_path, width=50, height=50)
-                if not img:
-                    # Last resort: try via PUBLIC_BASE_URL + relative media URL
-                    url = getattr(p.photo, "url", None)
-                    base = getattr(settings, "PUBLIC_BASE_URL", "")
-                    if url and base and url.startswith("/"):
-                        img = _url_image(urljoin(base + "/", url.lstrip("/")), width=50, height=50)
-        row = [img if img else "", p.name, getattr(p, "phone", "")]
-        ev = _latest_evaluation(p)
-        if ev:
-            row.append(rating_label_from_average(ev.average_rating))
-        else:
-            row.append("-")
-        data.append(row)
+    # Prefetch evaluations newest first to avoid N+1 queries in _latest_evaluation
+    from .models import PlayerEvaluation
+    latest_first = PlayerEvaluation.objects.order_by("-evaluated_at", "-updated_at")
+    players = list(
+        group.players.only("id", "group", "name", "phone", "photo")
+        .prefetch_related(Prefetch("evaluations", queryset=latest_first))
+    )
+    # Storage/HTTP photo reads dominate for large groups; overlap them
+    with ThreadPoolExecutor(max_workers=_PHOTO_FETCH_WORKERS) as executor:
+        photos = list(executor.map(lambda p: _player_photo(p.photo, 50), players))
+    latest = [_latest_evaluation(p) for p in players]
+    data += [
+        [img if img else "", p.name, p.phone, rating_label_from_average(ev.average_rating) if ev else "-"]
+        for p, img, ev in zip(players, photos, latest)
+    ]
 
     table = Table(data, repeatRows=1)
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-    ]))
+    table.setStyle(_GROUP_TABLE_STYLE)
     story.append(table)
 
     try:
         doc.build(story)
     except OSError:
-        # Fallback minimal PDF without images to avoid 500 errors
-        fallback_buffer = BytesIO()
-        fallback_doc = SimpleDocTemplate(fallback_buffer, pagesize=A4)
-        fallback_story = [Paragraph("Group Report", styles["Title"]), Spacer(1, 12), Paragraph(f"Group: {group.name}", styles["Normal"])]
+        # Fallback minimal PDF without images to avoid 500 errors. Nothing has
+        # been written yet: ReportLab only writes the file when the build completes.
+        fallback_doc = SimpleDocTemplate(fileobj, pagesize=A4)
+        fallback_story = [Paragraph("Group Report", styles.title), Spacer(1, 12), Paragraph(f"Group: {group.name}", styles.normal)]
         fallback_doc.build(fallback_story)
-        pdf = fallback_buffer.getvalue()
-        fallback_buffer.close()
-        buffer.close()
-        return pdf
+
+
+def build_player_report(player, month=None) -> bytes:
+    """Return the player report PDF as bytes."""
+    buffer = BytesIO()
+    build_player_report_to(buffer, player, month=month)
     pdf = buffer.getvalue()
     buffer.close()
     return pdf
 
 
-def build_player_report(player, month=None) -> bytes:
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4, leftMargin=24, rightMargin=24, topMargin=24, bottomMargin=24)
-    styles = getSampleStyleSheet()
+def build_player_report_to(fileobj, player, month=None) -> None:
+    """Write the player report PDF to a writable file-like object (see build_group_report_to)."""
+    doc = SimpleDocTemplate(fileobj, pagesize=A4, leftMargin=24, rightMargin=24, topMargin=24, bottomMargin=24)
+    styles = _styles()
     story = []
 
-    # Compact styles to fit on a single page
-    small_title = styles["Title"].clone("SmallTitle")
-    small_title.fontSize = 16
-    small_title.leading = 18
-    small_h2 = styles["Heading2"].clone("SmallH2")
-    small_h2.fontSize = 11
-    small_h2.leading = 13
-    small_h3 = styles["Heading3"].clone("SmallH3")
-    small_h3.fontSize = 10
-    small_h3.leading = 12
-    normal_small = styles["Normal"].clone("NormalSmall")
-    normal_small.fontSize = 9
-    normal_small.leading = 11
-
-    # Arabic-capable styles
-    arabic_font = _register_arabic_font()
-    arabic_label_style = normal_small.clone("ArabicLabel")
-    arabic_label_style.fontName = arabic_font
-    small_h3_ar = small_h3.clone("SmallH3Arabic")
-    small_h3_ar.fontName = arabic_font
-    arabic_right_heading = small_h3_ar.clone("ArabicRightHeading")
-    arabic_right_heading.alignment = TA_RIGHT
+    small_title = styles.small_title
+    small_h3 = styles.small_h3
+    normal_small = styles.normal_small
+    arabic_font = styles.arabic_font
+    arabic_label_style = styles.arabic_label
+    arabic_right_heading = styles.arabic_right_heading
 
     # Determine selected month for attendance summary (default: current month)
     from datetime import date
@@ -473,130 +752,33 @@ def build_player_report(player, month=None) -> bytes:
         details_lines.append(f"Phone: {player.phone}")
     details_para = Paragraph("<br/>".join(details_lines), normal_small)
 
-    img = None
-    if player.photo:
-        # Prefer reading bytes directly from storage
-        img = _image_from_field(player.photo, width=60, height=60)
-        if not img:
-            # Fallback to local filesystem path
-            img_path = getattr(player.photo, "path", None)
-            if not img_path:
-                img_path = str(Path(settings.MEDIA_ROOT) / player.photo.name)
-            img = _safe_image(img_path, width=60, height=60)
-            if not img:
-                # Last resort: attempt via PUBLIC_BASE_URL + relative media URL
-                url = getattr(player.photo, "url", None)
-                base = getattr(settings, "PUBLIC_BASE_URL", "")
-                if url and base and url.startswith("/"):
-                    img = _url_image(urljoin(base + "/", url.lstrip("/")), width=60, height=60)
+    img = _player_photo(player.photo, 60)
 
     logo = _logo_image(width=60, height=60)
     header_table = Table(
         [[logo if logo else "", title_para, img if img else ""], ["", details_para, ""]],
         colWidths=[70, None, 80],
     )
-    header_table.setStyle(TableStyle([
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("ALIGN", (2, 0), (2, 0), "RIGHT"),
-        ("LEFTPADDING", (0, 0), (-1, -1), 0),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-        ("TOPPADDING", (0, 0), (-1, -1), 0),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-    ]))
+    header_table.setStyle(_PLAYER_HEADER_STYLE)
     story.append(header_table)
     story.append(Spacer(1, 8))
 
     # Use the latest evaluation for the player (FK relation)
     ev = _latest_evaluation(player)
     if ev:
-        # Technical Skills (contextualized)
-        story.append(Paragraph(with_section_title_html("Technical skills in relation to the football context (decision making)", english_font_name=small_h3.fontName, arabic_font_name=arabic_font), small_h3))
-        tech_data = [
-            ["Skill", "Rating"],
-            [with_translation_para("Passing", arabic_label_style), Paragraph(rating_bilingual_html(ev.passing), normal_small)],
-            [with_translation_para("Ball receiving and post-reception action", arabic_label_style), Paragraph(rating_bilingual_html(ev.ball_control), normal_small)],
-            [with_translation_para("Dribbling", arabic_label_style), Paragraph(rating_bilingual_html(ev.dribbling), normal_small)],
-            [with_translation_para("Shooting", arabic_label_style), Paragraph(rating_bilingual_html(ev.shooting), normal_small)],
-            [with_translation_para("Using both feet", arabic_label_style), Paragraph(rating_bilingual_html(ev.using_both_feet), normal_small)],
-        ]
-        tech_table = Table(tech_data, repeatRows=1)
-        tech_table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-            ("LEFTPADDING", (0, 0), (-1, -1), 3),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 3),
-            ("TOPPADDING", (0, 0), (-1, -1), 2),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ]))
-        story.append(tech_table)
-        story.append(Spacer(1, 6))
-
-        # Physical Abilities (contextualized)
-        story.append(Paragraph(with_section_title_html("Physical abilities in relation to the football context", english_font_name=small_h3.fontName, arabic_font_name=arabic_font), small_h3))
-        phys_data = [
-            ["Attribute", "Rating"],
-            [with_translation_para("Speed", arabic_label_style), Paragraph(rating_bilingual_html(ev.speed), normal_small)],
-            [with_translation_para("Agility", arabic_label_style), Paragraph(rating_bilingual_html(ev.agility), normal_small)],
-            [with_translation_para("Endurance", arabic_label_style), Paragraph(rating_bilingual_html(ev.endurance), normal_small)],
-            [with_translation_para("Strength", arabic_label_style), Paragraph(rating_bilingual_html(ev.strength), normal_small)],
-        ]
-        phys_table = Table(phys_data, repeatRows=1)
-        phys_table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-            ("LEFTPADDING", (0, 0), (-1, -1), 3),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 3),
-            ("TOPPADDING", (0, 0), (-1, -1), 2),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ]))
-        story.append(phys_table)
-        story.append(Spacer(1, 6))
-
-        # Tactical skills (awareness and decision making)
-        story.append(Paragraph(with_section_title_html("Tactical skills should be in the context of (awareness and decision making)", english_font_name=small_h3.fontName, arabic_font_name=arabic_font), small_h3))
-        tu_data = [
-            ["Aspect", "Rating"],
-            [with_translation_para("Awareness of correct positioning", arabic_label_style), Paragraph(rating_bilingual_html(ev.positioning), normal_small)],
-            [with_translation_para("make the right decisions during the game", arabic_label_style), Paragraph(rating_bilingual_html(ev.decision_making), normal_small)],
-            [with_translation_para("Awareness of opponents and teammates", arabic_label_style), Paragraph(rating_bilingual_html(ev.game_awareness), normal_small)],
-            [with_translation_para("Teamwork", arabic_label_style), Paragraph(rating_bilingual_html(ev.teamwork), normal_small)],
-        ]
-        tu_table = Table(tu_data, repeatRows=1)
-        tu_table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-            ("LEFTPADDING", (0, 0), (-1, -1), 3),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 3),
-            ("TOPPADDING", (0, 0), (-1, -1), 2),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ]))
-        story.append(tu_table)
-        story.append(Spacer(1, 6))
-
-        # Psychological and mental (life skills context)
-        story.append(Paragraph(with_section_title_html("Psychological and mental aspects should be in the context of life skills", english_font_name=small_h3.fontName, arabic_font_name=arabic_font), small_h3))
-        psy_data = [
-            ["Aspect", "Rating"],
-            [with_translation_para("Respect", arabic_label_style), Paragraph(rating_bilingual_html(ev.respect), normal_small)],
-            [with_translation_para("Sportsmanship", arabic_label_style), Paragraph(rating_bilingual_html(ev.sportsmanship), normal_small)],
-            [with_translation_para("Self-confidence", arabic_label_style), Paragraph(rating_bilingual_html(ev.confidence), normal_small)],
-            [with_translation_para("Leadership", arabic_label_style), Paragraph(rating_bilingual_html(ev.leadership), normal_small)],
-        ]
-        psy_table = Table(psy_data, repeatRows=1)
-        psy_table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-            ("LEFTPADDING", (0, 0), (-1, -1), 3),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 3),
-            ("TOPPADDING", (0, 0), (-1, -1), 2),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ]))
-        story.append(psy_table)
-        story.append(Spacer(1, 6))
+        labels = _skill_label_paragraphs(arabic_label_style)
+        ratings = _rating_paragraphs(normal_small)
+        for section_title, header_label, skills in _PLAYER_REPORT_SECTIONS:
+            story.append(Paragraph(with_section_title_html(section_title, english_font_name=small_h3.fontName, arabic_font_name=arabic_font), small_h3))
+            section_data = [[header_label, "Rating"]]
+            section_data += [
+                [copy(labels[label]), _rating_para(ratings, getattr(ev, attr), normal_small)]
+                for attr, label in skills
+            ]
+            section_table = Table(section_data, repeatRows=1)
+            section_table.setStyle(_SKILL_TABLE_STYLE)
+            story.append(section_table)
+            story.append(Spacer(1, 6))
 
         # Overall
         story.append(Paragraph(with_section_title_html("Average Level", english_font_name=small_h3.fontName, arabic_font_name=arabic_font) + f": {rating_bilingual_html_from_average(ev.average_rating)}", small_h3))
@@ -611,7 +793,7 @@ def build_player_report(player, month=None) -> bytes:
             story.append(Spacer(1, 4))
             story.append(Paragraph(f"Notes: {ev.notes}", normal_small))
     else:
-        story.append(Paragraph("No evaluation available.", styles["Normal"]))
+        story.append(Paragraph("No evaluation available.", styles.normal))
 
     # Final Arabic note section split into two questions
     try:
@@ -630,11 +812,8 @@ def build_player_report(player, month=None) -> bytes:
         doc.build(story)
     except OSError:
         # Fallback minimal PDF to avoid 500 errors
-        SimpleDocTemplate(buffer, pagesize=A4).build([
-            Paragraph("Player Report", styles["Title"]),
+        SimpleDocTemplate(fileobj, pagesize=A4).build([
+            Paragraph("Player Report", styles.title),
             Spacer(1, 12),
-            Paragraph(f"Name: {player.name}", styles["Normal"]),
+            Paragraph(f"Name: {player.name}", styles.normal),
         ])
-    pdf = buffer.getvalue()
-    buffer.close()
-    return pdf
@@ -37,4 +37,22 @@ class PdfReportsTestCase(TestCase):
         res = self.client.get(f"/api/players/{self.player.id}/report-pdf/")
         self.assertEqual(res.status_code, 200)
         self.assertEqual(res["Content-Type"], "application/pdf")
-        self.assertTrue(res.content[:4] == b"%PDF")
\ No newline at end of file
+        self.assertTrue(res.content[:4] == b"%PDF")
+
+class GroupReportQueriesTestCase(TestCase):
+    def setUp(self):
+        coach_user = User.objects.create_user(username="coach1", password="coach123")
+        self.coach = Coach.objects.create(user=coach_user, bio="Coach")
+        self.group = Group.objects.create(name="Group A", description="A", coach=self.coach)
+        for name in ("Alice", "Bob", "Charlie"):
+            player = Player.objects.create(group=self.group, name=name, age=13)
+            PlayerEvaluation.objects.create(player=player, coach=self.coach, passing=2)
+            PlayerEvaluation.objects.create(player=player, coach=self.coach, passing=5)
+
+    def test_latest_evaluations_are_prefetched(self):
+        from core.pdf import build_group_report
+
+        # One query for players, one for their evaluations, regardless of group size
+        with self.assertNumQueries(2):
+            pdf = build_group_report(self.group)
+        self.assertTrue(pdf[:4] == b"%PDF")
@@ -18,7 +18,7 @@ from .serializers import (
     UserSerializer,
 )
 from .permissions import IsAdmin, IsAdminOrCoachWriteOwnGroup, IsAdminOrCoachOfObject
-from .pdf import build_group_report, build_player_report
+from .pdf import build_group_report_to, build_player_report_to
 
 
 class CoachViewSet(viewsets.ModelViewSet):
@@ -88,8 +88,8 @@ class GroupViewSet(viewsets.ModelViewSet):
         group = self.get_object()
         # object-level permission
         self.check_object_permissions(request, group)
-        pdf_bytes = build_group_report(group)
-        response = HttpResponse(pdf_bytes, content_type="application/pdf")
+        response = HttpResponse(content_type="application/pdf")
+        build_group_report_to(response, group)
         response["Content-Disposition"] = f'attachment; filename="group_{group.id}_report.pdf"'
         return response
 
@@ -246,8 +246,8 @@ class PlayerViewSet(viewsets.ModelViewSet):
                 # Ignore invalid month; fall back to current month inside builder
                 month_date = None
 
-        pdf_bytes = build_player_report(player, month=month_date)
-        response = HttpResponse(pdf_bytes, content_type="application/pdf")
+        response = HttpResponse(content_type="application/pdf")
+        build_player_report_to(response, player, month=month_date)
         response["Content-Disposition"] = f'attachment; filename="player_{player.id}_report.pdf"'
         return response
 